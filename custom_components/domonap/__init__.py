@@ -7,11 +7,13 @@ from typing import TYPE_CHECKING
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     DOMAIN,
     API,
+    DEFAULT_ENTRY_ID,
     PARAM_ACCESS_TOKEN,
     PARAM_DEVICE_TOKEN,
     PARAM_INSTANCE_ID,
@@ -22,6 +24,7 @@ from .const import (
     UPDATE_INTERVAL,
     WEBRTC_PROXY,
 )
+from .util import invalidate_phone_digits
 
 if TYPE_CHECKING:
     from .api import IntercomAPI
@@ -49,6 +52,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     from .notify_consumer import IntercomNotifyConsumer
 
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
+    hass.data[DOMAIN].pop(DEFAULT_ENTRY_ID, None)
 
     api = IntercomAPI(
         device_token=entry.data.get(PARAM_DEVICE_TOKEN),
@@ -87,6 +91,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     api.token_update_callback = update_entry
 
+    # Every platform builds its entities from the key list; fetch it once.
+    try:
+        keys_response = await api.get_paged_keys()
+    except Exception as err:
+        keys_response = {"error": str(err)}
+    # _post reports HTTP / auth failures as {"error": ...} instead of raising.
+    if not isinstance(keys_response, dict) or "error" in keys_response:
+        await api.close()
+        # Entries in setup-retry are never unloaded; don't leave a dead bucket behind.
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN].pop(DEFAULT_ENTRY_ID, None)
+        raise ConfigEntryNotReady(f"Failed to load Domonap keys: {keys_response}")
+    hass.data[DOMAIN][entry.entry_id]["keys"] = keys_response
+
     consumer = IntercomNotifyConsumer(hass, api)
     hass.data[DOMAIN][entry.entry_id][API] = api
     hass.data[DOMAIN][entry.entry_id]["notify_consumer"] = consumer
@@ -132,10 +150,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.debug("Exception while closing API client", exc_info=True)
 
     hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    hass.data.get(DOMAIN, {}).pop(DEFAULT_ENTRY_ID, None)
+    invalidate_phone_digits(entry.entry_id)
 
     # If this was the last entry, remove services.
     remaining_entries = [
-        key for key in hass.data.get(DOMAIN, {}) if key != WEBRTC_PROXY
+        key for key in hass.data.get(DOMAIN, {}) if key not in (WEBRTC_PROXY, DEFAULT_ENTRY_ID)
     ]
     if not remaining_entries:
         from .actions import async_unload_actions
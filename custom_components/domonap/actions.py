@@ -6,10 +6,11 @@ from typing import Any
 import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, API
-from .util import extract_phone_digits
+from .const import DOMAIN, API, DEFAULT_ENTRY_ID, EMPTY_STATES, LAST_CALL_SUFFIX, WEBRTC_PROXY
+from .util import clean_call_id, extract_phone_digits
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +18,9 @@ SERVICE_OPEN_RELAY_BY_DOOR_ID = "open_relay_by_door_id"
 SERVICE_OPEN_RELAY_BY_KEY_ID = "open_relay_by_key_id"
 SERVICE_OPEN_RELAY_BY_LAST_CALL_DOOR_ID = "open_relay_by_last_call_door_id"
 
+# hass.data[DOMAIN] keys that are not config entry ids.
+_NON_ENTRY_KEYS = frozenset({WEBRTC_PROXY, DEFAULT_ENTRY_ID})
+
 SERVICE_OPEN_RELAY_BY_DOOR_ID_SCHEMA = vol.Schema(
     {
         vol.Required("door_id"): cv.string,
@@ -49,37 +53,63 @@ def _select_entry_id(hass: HomeAssistant, requested_entry_id: str | None) -> str
         return None
 
     if requested_entry_id:
+        if requested_entry_id in _NON_ENTRY_KEYS:
+            return None
         return requested_entry_id if requested_entry_id in domain_data else None
 
-    # Fallback: first configured entry
-    return next(iter(domain_data.keys()), None)
+    # Fallback: first configured entry, memoized until entries change
+    entry_id = domain_data.get(DEFAULT_ENTRY_ID)
+    if entry_id is None:
+        entry_id = next((key for key in domain_data if key not in _NON_ENTRY_KEYS), None)
+        if entry_id is not None:
+            domain_data[DEFAULT_ENTRY_ID] = entry_id
+    return entry_id
+
+
+def _get_api(hass: HomeAssistant, entry_id: str) -> Any:
+    return hass.data[DOMAIN].get(entry_id, {}).get(API)
 
 
 def _find_last_call_sensor_entity_id(hass: HomeAssistant, entry_id: str | None) -> str | None:
     """Try to find last_call_door_id sensor entity_id."""
-    # Prefer the new naming: sensor.<phone_digits>_last_call_door_id
     if entry_id:
+        # Fast path: the sensor registers its entity_id once added to hass.
+        stored = hass.data.get(DOMAIN, {}).get(entry_id, {})
+        cached = stored.get("last_call_sensor_entity_id")
+        if cached and hass.states.get(cached) is not None:
+            return cached
+
         try:
             entry = hass.config_entries.async_get_entry(entry_id)
         except Exception:
             entry = None
 
         if entry is not None:
-            phone_digits = extract_phone_digits(entry)
-            if phone_digits:
-                candidate = f"sensor.{phone_digits}_last_call_door_id"
-                if hass.states.get(candidate) is not None:
-                    return candidate
+            # Resolve by the unique_id assigned in DomonapLastCallDoorIdSensor.
+            unique_id = f"{extract_phone_digits(entry) or entry_id}{LAST_CALL_SUFFIX}"
+            candidate = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, unique_id)
+            if candidate and hass.states.get(candidate) is not None:
+                return candidate
 
         # Backward compatibility (previous logic)
-        legacy = f"sensor.{DOMAIN}_{entry_id}_last_call_door_id"
+        legacy = f"sensor.{DOMAIN}_{entry_id}{LAST_CALL_SUFFIX}"
         if hass.states.get(legacy) is not None:
             return legacy
 
-    # Fallback: first sensor entity with expected unique_id suffix in entity_id
-    for st in hass.states.async_all("sensor"):
-        if st.entity_id.endswith("_last_call_door_id") and st.entity_id.startswith("sensor."):
-            return st.entity_id
+        # Fallback: any last-call sensor of this config entry (e.g. renamed).
+        for reg_entry in er.async_entries_for_config_entry(er.async_get(hass), entry_id):
+            if reg_entry.domain != "sensor":
+                continue
+            if reg_entry.unique_id.endswith(LAST_CALL_SUFFIX) or reg_entry.entity_id.endswith(LAST_CALL_SUFFIX):
+                if hass.states.get(reg_entry.entity_id) is not None:
+                    return reg_entry.entity_id
+        return None
+
+    # No entry selected: any last-call sensor registered in hass.data.
+    for stored in hass.data.get(DOMAIN, {}).values():
+        if isinstance(stored, dict) and (cached := stored.get("last_call_sensor_entity_id")):
+            if hass.states.get(cached) is not None:
+                return cached
 
     return None
 
@@ -96,7 +126,7 @@ async def async_setup_actions(hass: HomeAssistant) -> None:
             _LOGGER.error("No Domonap config entries are set up")
             raise HomeAssistantError("No Domonap config entries are set up")
 
-        api = hass.data[DOMAIN][entry_id].get(API)
+        api = _get_api(hass, entry_id)
         if api is None:
             _LOGGER.error("Domonap API is not available for entry_id=%s", entry_id)
             raise HomeAssistantError(f"Domonap API is not available for entry_id={entry_id}")
@@ -118,7 +148,7 @@ async def async_setup_actions(hass: HomeAssistant) -> None:
             _LOGGER.error("No Domonap config entries are set up")
             raise HomeAssistantError("No Domonap config entries are set up")
 
-        api = hass.data[DOMAIN][entry_id].get(API)
+        api = _get_api(hass, entry_id)
         if api is None:
             _LOGGER.error("Domonap API is not available for entry_id=%s", entry_id)
             raise HomeAssistantError(f"Domonap API is not available for entry_id={entry_id}")
@@ -138,7 +168,7 @@ async def async_setup_actions(hass: HomeAssistant) -> None:
         if not entry_id:
             return {"status": "error", "reason": "no_config_entries"}
 
-        api = hass.data[DOMAIN][entry_id].get(API)
+        api = _get_api(hass, entry_id)
         if api is None:
             return {"status": "error", "reason": "api_unavailable", "config_entry_id": entry_id}
 
@@ -153,14 +183,14 @@ async def async_setup_actions(hass: HomeAssistant) -> None:
         if st is None:
             return {"status": "error", "reason": "sensor_not_found", "entity_id": entity_id}
 
-        if st.state in ("unknown", "unavailable", "none", "None", ""):
+        if st.state in EMPTY_STATES:
             return {"status": "skipped", "reason": "no_last_call", "entity_id": entity_id, "state": st.state}
 
         door_id = st.state
 
         attrs = st.attributes or {}
         raw_call_id = attrs.get("CallId")
-        call_id = str(raw_call_id).strip() if raw_call_id is not None else ""
+        call_id = clean_call_id(raw_call_id)
 
         # Try to get a human-friendly door name from sensor attributes.
         door_name = None
@@ -11,7 +11,7 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass, config_entry, async_add_entities):
     entities = []
     api = hass.data[DOMAIN][config_entry.entry_id][API]
-    response = await api.get_paged_keys()
+    response = hass.data[DOMAIN][config_entry.entry_id]["keys"]
 
     if not isinstance(response, dict):
         _LOGGER.warning(
@@ -1,11 +1,14 @@
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN, API
-from .util import extract_phone_digits
+from .const import DOMAIN, API, EMPTY_STATES, LAST_CALL_SUFFIX
+from .util import clean_call_id, extract_phone_digits
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,18 +23,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     entities.append(IntercomOpenLastCallDoor(api, config_entry.entry_id, phone_digits))
 
     # Existing per-door buttons
-    response = await api.get_paged_keys()
+    response = hass.data[DOMAIN][config_entry.entry_id]["keys"]
     keys = response.get("results", [])
     for key in keys:
         key_id = key["id"]
         door_id = key["doorId"]
         door_name = key["name"]
-        entities.append(IntercomDoor(api, key_id, door_id, door_name, key))
+        entities.append(IntercomDoor(api, key_id, door_id, door_name, MappingProxyType(key)))
 
     async_add_entities(entities, True)
 
 
 class IntercomOpenLastCallDoor(ButtonEntity):
+    __slots__ = ("_api", "_entry_id", "_phone_digits", "_suggested_object_id")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:phone-incoming"
     _attr_translation_key = "open_relay_by_last_call_door_id"
@@ -41,37 +46,32 @@ class IntercomOpenLastCallDoor(ButtonEntity):
         self._entry_id = entry_id
         self._phone_digits = phone_digits
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._phone_digits}_open_relay_by_last_call_door_id"
-
-    @property
-    def device_info(self):
-        phone = self._phone_digits or self._entry_id
-        return {
+        phone = phone_digits or entry_id
+        self._attr_unique_id = f"{phone_digits}_open_relay_by_last_call_door_id"
+        # Ensures entity_id like button.<phone>_open_relay_by_last_call_door_id
+        self._suggested_object_id = self._attr_unique_id
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, phone)},
             "name": f"Domonap {phone}",
             "manufacturer": "Domonap",
             "model": "Domonap Account",
         }
 
-
     @property
     def suggested_object_id(self) -> str:
-        # Ensures entity_id like button.<phone>_open_relay_by_last_call_door_id
-        return f"{self._phone_digits}_open_relay_by_last_call_door_id"
+        return self._suggested_object_id
 
     async def async_press(self) -> None:
         # Find last-call sensor and open by its door_id.
-        sensor_entity_id = f"sensor.{self._phone_digits}_last_call_door_id"
+        sensor_entity_id = f"sensor.{self._phone_digits}{LAST_CALL_SUFFIX}"
         state = self.hass.states.get(sensor_entity_id) if self.hass else None
-        if state is None or state.state in ("unknown", "unavailable", "none", "None", ""):
+        if state is None or state.state in EMPTY_STATES:
             _LOGGER.debug("No last call door_id found in %s", sensor_entity_id)
             return
 
         door_id = state.state
         raw_call_id = state.attributes.get("CallId") if state.attributes else None
-        call_id = str(raw_call_id).strip() if raw_call_id is not None else ""
+        call_id = clean_call_id(raw_call_id)
         try:
             res = await self._api.open_relay_by_door_id(door_id)
             if not (isinstance(res, dict) and res.get("ok") is True):
@@ -79,50 +79,57 @@ class IntercomOpenLastCallDoor(ButtonEntity):
                 return
 
             # Simplified: CallId must be non-empty after strip().
+            # The call must only be ended once the door is open, but the press
+            # doesn't need to wait for it.
             if call_id:
-                end_res = await self._api.end_call_notify(call_id)
-                if not (isinstance(end_res, dict) and end_res.get("ok") is True):
-                    _LOGGER.error("end_call_notify failed for call_id=%s: %s", call_id, end_res)
+                self.platform.config_entry.async_create_background_task(
+                    self.hass, self._async_end_call(call_id), f"{DOMAIN}_end_call_{call_id}"
+                )
 
         except Exception:
             _LOGGER.exception("Error opening relay by last call door_id=%s", door_id)
 
+    async def _async_end_call(self, call_id: str) -> None:
+        try:
+            end_res = await self._api.end_call_notify(call_id)
+            if not (isinstance(end_res, dict) and end_res.get("ok") is True):
+                _LOGGER.error("end_call_notify failed for call_id=%s: %s", call_id, end_res)
+        except Exception:
+            _LOGGER.exception("end_call_notify failed for call_id=%s", call_id)
+
 
 class IntercomDoor(ButtonEntity):
+    __slots__ = ("_api", "_key_id", "_door_id", "_name", "_key_data")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:lock"
     _attr_translation_key = "open_door"
 
-    def __init__(self, api, key_id, door_id: str, name: str, key_data: dict):
+    def __init__(self, api, key_id, door_id: str, name: str, key_data: Mapping[str, Any]):
         self._api = api
         self._key_id = key_id
         self._door_id = door_id
         self._name = name
         self._key_data = key_data
 
+        self._attr_unique_id = door_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, key_id)},
+            "name": name,
+            "manufacturer": "Domonap",
+            "model": "Intercom Device",
+            "via_device": (DOMAIN, key_id),
+        }
+
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         return self._key_data
 
-    @property
-    def unique_id(self):
-        return self._door_id
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._key_id)},
-            "name": self._name,
-            "manufacturer": "Domonap",
-            "model": "Intercom Device",
-            "via_device": (DOMAIN, self._key_id),
-        }
-
     async def async_press(self):
         try:
             response = await self._api.open_relay_by_key_id(self._key_id)
             if response.get('ok') is not True:
-                _LOGGER.error(f"Failed to open the door {self._name}. Response: {response}")
+                _LOGGER.error("Failed to open the door %s. Response: %s", self._name, response)
         except Exception as e:
-            _LOGGER.error(f"Error opening the door {self._name}: {e}")
\ No newline at end of file
+            _LOGGER.error("Error opening the door %s: %s", self._name, e)
\ No newline at end of file
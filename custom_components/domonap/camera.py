@@ -59,7 +59,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     api = hass.data[DOMAIN][config_entry.entry_id][API]
     proxy = hass.data[DOMAIN][WEBRTC_PROXY]
     proxy_secret = config_entry.data.get(PARAM_WEBRTC_PROXY_SECRET)
-    key_response = await api.get_paged_keys()
+    key_response = hass.data[DOMAIN][config_entry.entry_id]["keys"]
     key_entities = _build_key_camera_entities(api, proxy, proxy_secret, key_response)
     if key_entities:
         async_add_entities(key_entities, True)
@@ -315,7 +315,7 @@ class IntercomCamera(Camera):
 
         response = await self._api.fetch_external_bytes(self._snapshot_url)
         if response["ok"]:
-            _LOGGER.debug(f"Successfully fetched snapshot for {self._name}")
+            _LOGGER.debug("Successfully fetched snapshot for %s", self._name)
             return response["body"]
 
         _LOGGER.error(
@@ -345,7 +345,7 @@ class IntercomCamera(Camera):
         return info
 
     async def async_update(self):
-        _LOGGER.debug(f"Updating camera: {self._name}")
+        _LOGGER.debug("Updating camera: %s", self._name)
 
 
 class IntercomWebRTCCamera(IntercomCamera):
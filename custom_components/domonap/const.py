@@ -19,6 +19,11 @@ PARAM_INSTANCE_ID = "instance_id"
 PARAM_WEBRTC_PROXY_SECRET = "webrtc_proxy_secret"
 EVENT_INCOMING_CALL = "domonap_incoming_call"
 WEBRTC_PROXY = "webrtc_proxy"
+DEFAULT_ENTRY_ID = "default_entry_id"
+LAST_CALL_SUFFIX = "_last_call_door_id"
+
+# Sensor states meaning "no last call recorded".
+EMPTY_STATES = frozenset({"unknown", "unavailable", "none", "None", ""})
 
 PLATFORMS: list[Platform] = [Platform.BUTTON, Platform.CAMERA, Platform.BINARY_SENSOR, Platform.SENSOR, Platform.IMAGE]
 
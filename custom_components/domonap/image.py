@@ -18,7 +18,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     entities: list[IntercomCallImageEntity] = []
     api = hass.data[DOMAIN][config_entry.entry_id][API]
 
-    response = await api.get_paged_keys()
+    response = hass.data[DOMAIN][config_entry.entry_id]["keys"]
     keys = response.get("results", [])
 
     for key in keys:
@@ -138,13 +138,13 @@ class IntercomNotifyConsumer:
                     push_data["PhotoUrl"] = PHOTO_URL + str(push_data.get("CallId", ""))
                     self._hass.bus.fire(EVENT_INCOMING_CALL, push_data)
                     _LOGGER.debug("Incoming call: %s", push_data)
-                else:
+                elif _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Unknown EventMessage=%s push=%s", evt, str(push_data)[:200])
         elif target in ('ReceiveOnline', "ReceiveOffline"):
             user = data.get('arguments')[0]
             status = data.get('target').replace('ReceiveO', 'o')
 
-            _LOGGER.debug(f"User {user} is {status}")
+            _LOGGER.debug("User %s is %s", user, status)
 
             self._hass.bus.fire("domonap_user_status_changed", {
                 'user': user,
@@ -154,18 +154,18 @@ class IntercomNotifyConsumer:
             # Обработка ситуации когда под одним аккаунтом выполнен вход (реакция на выход) в приложение
             # После события offline на все сессии текущего пользователя перестают приходить уведомления о звонках
             if user == self._username and status == "offline":
-                _LOGGER.debug(f"Current login user: {user} status changed to {status}. Reconnecting websocket...")
+                _LOGGER.debug("Current login user: %s status changed to %s. Reconnecting websocket...", user, status)
                 await self.stop()
                 await self.start()
 
         elif target == "ReceiveMessage":
             chat_data = data.get('arguments')[0]
             self._hass.bus.fire("domonap_receive_message", chat_data)
-            _LOGGER.debug(f"Received message from {chat_data.get('sender')}: {chat_data.get('text')}")
+            _LOGGER.debug("Received message from %s: %s", chat_data.get('sender'), chat_data.get('text'))
         elif target == 'ReceiveRead':
-            _LOGGER.debug(f"Read confirm messages in channel {data.get('arguments')[0]}")
+            _LOGGER.debug("Read confirm messages in channel %s", data.get('arguments')[0])
         else:
-            _LOGGER.debug(f"Unknown target type {data.get('target')} message:\n{data}")
+            _LOGGER.debug("Unknown target type %s message:\n%s", data.get('target'), data)
 
     async def _publish_updates(self) -> None:
         for cb in list(self._callbacks):
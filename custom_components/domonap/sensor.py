@@ -1,24 +1,26 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Optional, Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN, API, EVENT_INCOMING_CALL
+from .const import DOMAIN, EVENT_INCOMING_CALL, LAST_CALL_SUFFIX
 from .util import extract_phone_digits
 
 _LOGGER = logging.getLogger(__name__)
 
+_TS_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
     entities: list[SensorEntity] = []
-    api = hass.data[DOMAIN][config_entry.entry_id][API]
 
-    response = await api.get_paged_keys()
+    response = hass.data[DOMAIN][config_entry.entry_id]["keys"]
     keys = response.get("results", [])
 
     for key in keys:
@@ -42,7 +44,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
                     door_id=door_id,
                     device_name=door_name,
                     pin=pin,
-                    key_data=key,
+                    key_data=MappingProxyType(key),
                 ))
 
         except Exception:
@@ -56,21 +58,28 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
 
 class DomonapDoorCodeSensor(SensorEntity):
+    __slots__ = ("_key_id", "_door_id", "_device_name", "_pin", "_key_data")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:key-variant"
     _attr_translation_key = "door_code"
     _attr_should_poll = False
 
-    def __init__(self, key_id: str, door_id: str, device_name: str, pin: str, key_data: dict):
+    def __init__(self, key_id: str, door_id: str, device_name: str, pin: str, key_data: Mapping[str, Any]):
         self._key_id = key_id
         self._door_id = door_id
         self._device_name = device_name
         self._pin = pin
         self._key_data = key_data
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._door_id}_door_code"
+        self._attr_unique_id = f"{door_id}_door_code"
+        # Имя устройства — это "дверь". Сущность будет называться "<device>: <translated entity name>"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, key_id)},
+            "name": device_name,
+            "manufacturer": "Domonap",
+            "model": "Intercom Device",
+        }
 
     @property
     def native_value(self) -> str | None:
@@ -81,20 +90,12 @@ class DomonapDoorCodeSensor(SensorEntity):
         """Return the state attributes."""
         return self._key_data
 
-    @property
-    def device_info(self):
-        # Имя устройства — это "дверь". Сущность будет называться "<device>: <translated entity name>"
-        return {
-            "identifiers": {(DOMAIN, self._key_id)},
-            "name": self._device_name,
-            "manufacturer": "Domonap",
-            "model": "Intercom Device",
-        }
-
 
 class DomonapLastCallDoorIdSensor(SensorEntity):
     """Sensor that stores DoorId of the last incoming call."""
 
+    __slots__ = ("_hass", "_entry_id", "_phone_digits", "_state", "_attrs", "_unsub", "_suggested_object_id")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:phone-incoming"
     _attr_translation_key = "last_call_door_id"
@@ -108,31 +109,23 @@ class DomonapLastCallDoorIdSensor(SensorEntity):
         self._attrs: dict[str, Any] = {}
         self._unsub = None
 
-    @property
-    def device_info(self):
+        # Required by the task: base it on phone digits.
+        self._attr_unique_id = f"{phone_digits or entry_id}{LAST_CALL_SUFFIX}"
+        # Enforces entity_id like sensor.<phone_digits>_last_call_door_id
+        self._suggested_object_id = f"{phone_digits}{LAST_CALL_SUFFIX}" if phone_digits else None
         # Отображаем сенсор как часть устройства-аккаунта (телефон).
         # Идентификатор должен быть стабильным и уникальным.
-        phone = self._phone_digits or self._entry_id
-        return {
+        phone = phone_digits or entry_id
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, phone)},
             "name": f"Domonap {phone}",
             "manufacturer": "Domonap",
             "model": "Domonap Account",
         }
 
-    @property
-    def unique_id(self) -> str:
-        # Required by the task: base it on phone digits.
-        if self._phone_digits:
-            return f"{self._phone_digits}_last_call_door_id"
-        return f"{self._entry_id}_last_call_door_id"
-
     @property
     def suggested_object_id(self) -> str | None:
-        # Enforces entity_id like sensor.<phone_digits>_last_call_door_id
-        if self._phone_digits:
-            return f"{self._phone_digits}_last_call_door_id"
-        return None
+        return self._suggested_object_id
 
     @property
     def native_value(self) -> str | None:
@@ -144,25 +137,38 @@ class DomonapLastCallDoorIdSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         self._unsub = self._hass.bus.async_listen(EVENT_INCOMING_CALL, self._handle_incoming_call)
+        # Lets actions resolve the sensor without scanning the state machine.
+        self._hass.data[DOMAIN].setdefault(self._entry_id, {})["last_call_sensor_entity_id"] = self.entity_id
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub:
             self._unsub()
             self._unsub = None
+        stored = self._hass.data.get(DOMAIN, {}).get(self._entry_id)
+        if stored and stored.get("last_call_sensor_entity_id") == self.entity_id:
+            stored.pop("last_call_sensor_entity_id", None)
 
     @callback
     def _handle_incoming_call(self, event) -> None:
         # Store DoorId as main state and keep the whole event payload as attributes.
-        door_id = event.data.get("DoorId")
+        try:
+            door_id = event.data["DoorId"]
+        except KeyError:
+            return
         if not door_id:
             return
 
-        self._state = str(door_id)
+        new_state = str(door_id)
+        # Same call delivered again (retry / duplicate event): nothing to write.
+        # Without a CallId we can't tell a repeat from a new ring, so always write.
+        call_id = event.data.get("CallId")
+        if call_id is not None and new_state == self._state and call_id == self._attrs.get("CallId"):
+            return
 
-        # event.data should be JSON-serializable (dict with simple values). Keep it as-is.
-        # Add our own timestamp of when HA processed the event.
-        attrs = dict(event.data)
-        attrs["ts"] = datetime.now(timezone.utc).isoformat() + "Z"
+        self._state = new_state
 
-        self._attrs = attrs
+        # event.data should be JSON-serializable (dict with simple values). Keep it as-is.
+        # Add our own timestamp of when HA received the event. time_fired is
+        # already set by the event bus, so no extra clock read is needed.
+        self._attrs = {**event.data, "ts": event.time_fired.strftime(_TS_FORMAT)}
         self.async_write_ha_state()
@@ -2,24 +2,61 @@ from __future__ import annotations
 
 import re
 
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 
+_NON_DIGIT = re.compile(r"\D")
+_MISSING = object()
+
+# entry_id -> phone digits (or None). Cleared on entry unload.
+_PHONE_CACHE: dict[str, str | None] = {}
+
 
 def extract_phone_digits(entry: ConfigEntry) -> str | None:
     """Return phone number containing only digits.
 
     Prefers `entry.data["phone_number"]` (already sanitized by config flow),
     falls back to parsing `entry.title` (format like "+7 9991234567").
+    The result is cached per entry_id, see `invalidate_phone_digits`.
     """
+    cached = _PHONE_CACHE.get(entry.entry_id, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    digits = _parse_phone_digits(entry)
+    _PHONE_CACHE[entry.entry_id] = digits
+    return digits
+
 
+def invalidate_phone_digits(entry_id: str) -> None:
+    """Drop cached phone digits for a config entry."""
+    _PHONE_CACHE.pop(entry_id, None)
+
+
+def clean_call_id(value: Any) -> str:
+    """Return CallId as a stripped string ("" when missing)."""
+    if value is None:
+        return ""
+    if type(value) is str:
+        # Already clean in the common case: skip the extra allocations.
+        if value and (value[0].isspace() or value[-1].isspace()):
+            return value.strip()
+        return value
+    return str(value).strip()
+
+
+def _parse_phone_digits(entry: ConfigEntry) -> str | None:
     # Prefer explicit data (from config_flow)
     phone = entry.data.get("phone_number")
-    if isinstance(phone, str) and phone.strip():
-        digits = re.sub(r"\D", "", phone)
+    if isinstance(phone, str) and (phone := phone.strip()):
+        # Config flow stores digits only; the regex is just a safety net.
+        if phone.isascii() and phone.isdigit():
+            return phone
+        digits = _NON_DIGIT.sub("", phone)
         return digits or None
 
     # Fallback: parse from title
     title = entry.title or ""
-    digits = re.sub(r"\D", "", title)
+    digits = _NON_DIGIT.sub("", title)
     return digits or None
-